@@ -3,14 +3,23 @@ FastAPI Calculator Application.
 Provides REST API endpoints for calculator operations.
 """
 import logging
-from typing import Dict, Union
-
+import math
+import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, List, Literal, Mapping, Tuple, Union
+
+import numpy as np
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import Response
 
 from app.operations import (
@@ -20,22 +29,51 @@ from app.operations import (
     modulo,
     multiply,
     power,
+    power_batch,
     subtract,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Configure logging (level overridable via LOG_LEVEL, e.g. WARNING in prod).
+# Handlers enqueue records in O(1); a background listener thread does the
+# actual stderr writes so the request path never blocks on log I/O.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_stderr_handler = logging.StreamHandler()
+_stderr_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_listener = QueueListener(_log_queue, _stderr_handler)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(os.getenv("LOG_LEVEL", "WARNING"))
+_root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the log-draining listener thread for the app's lifetime.
+
+    Also renders the calculator page up front so the first request is
+    served from the cache like every later one.
+    """
+    global _index_html
+    _log_listener.start()
+    _index_html = _render_index()
+    yield
+    _log_listener.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Calculator API",
     description="A simple calculator API with basic arithmetic operations",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Compress larger responses (the HTML page, big /batch arrays)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
@@ -43,26 +81,26 @@ templates = Jinja2Templates(directory="templates")
 
 # Pydantic models for request/response
 class CalculationRequest(BaseModel):
-    a: Union[int, float] = Field(..., description="First number")
-    b: Union[int, float] = Field(..., description="Second number")
+    model_config = ConfigDict(json_schema_extra={"example": {"a": 10, "b": 5}})
 
-    class Config:
-        json_schema_extra = {"example": {"a": 10, "b": 5}}
+    a: float = Field(..., description="First number")
+    b: float = Field(..., description="Second number")
 
 
 class CalculationResponse(BaseModel):
-    result: Union[int, float] = Field(..., description="Result of the calculation")
-    operation: str = Field(..., description="Operation performed")
-    operands: Dict[str, Union[int, float]] = Field(..., description="Input operands")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "result": 15,
                 "operation": "addition",
                 "operands": {"a": 10, "b": 5},
             }
         }
+    )
+
+    result: float = Field(..., description="Result of the calculation")
+    operation: str = Field(..., description="Operation performed")
+    operands: Dict[str, float] = Field(..., description="Input operands")
 
 
 class ErrorResponse(BaseModel):
@@ -70,12 +108,105 @@ class ErrorResponse(BaseModel):
     operation: str = Field(..., description="Operation that failed")
 
 
+class BatchItem(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"op": "add", "a": 10, "b": 5}}
+    )
+
+    op: Literal["add", "subtract", "multiply", "divide", "power", "modulo"] = Field(
+        ..., description="Operation to perform"
+    )
+    a: float = Field(..., description="First number")
+    b: float = Field(..., description="Second number")
+
+
+# Frozen dispatch table: path segment -> (callable, display name)
+OPS: Mapping[str, Tuple[Callable[..., Union[int, float]], str]] = MappingProxyType(
+    {
+        "add": (add, "addition"),
+        "subtract": (subtract, "subtraction"),
+        "multiply": (multiply, "multiplication"),
+        "divide": (divide, "division"),
+        "power": (power, "power"),
+        "modulo": (modulo, "modulo"),
+    }
+)
+
+# Upper bound on operations per batch request
+MAX_BATCH_SIZE = 100
+
+
+def _make_responder(name: str) -> Callable[[float, float, float], Response]:
+    """Build a serializer specialized for one operation name.
+
+    The operation string is closed over once, so each reply is a single
+    orjson.dumps of a pre-shaped dict handed straight to Response,
+    bypassing FastAPI's generic response encoding.
+    """
+
+    def respond(result: float, a: float, b: float) -> Response:
+        return Response(
+            orjson.dumps(
+                {"result": result, "operation": name, "operands": {"a": a, "b": b}}
+            ),
+            media_type="application/json",
+        )
+
+    return respond
+
+
+# One cached responder per operation, keyed by path segment
+_RESPONDERS: Mapping[str, Callable[[float, float, float], Response]] = (
+    MappingProxyType({op: _make_responder(name) for op, (_, name) in OPS.items()})
+)
+
+# Vectorized kernels for the batch endpoint, one C-level loop per operation
+_UFUNCS: Mapping[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = (
+    MappingProxyType(
+        {
+            "add": np.add,
+            "subtract": np.subtract,
+            "multiply": np.multiply,
+            "divide": np.true_divide,
+            "power": power_batch,
+            "modulo": np.mod,
+        }
+    )
+)
+
+# Operations whose divisor must be non-zero, with the matching error message
+_ZERO_DIVISOR_MESSAGES = MappingProxyType(
+    {
+        "divide": "Division by zero is not allowed",
+        "modulo": "Modulo by zero is not allowed",
+    }
+)
+
+# Error reported for batch items whose value overflows or is undefined;
+# orjson would otherwise serialize the inf/NaN result as null.
+_NONFINITE_MESSAGE = "Result out of range"
+
+
+# Rendered calculator page, cached as bytes. The template's asset links
+# are app-relative, so a single render is valid for every host and
+# scheme the app is served under. Populated at startup by lifespan().
+_index_html: bytes = b""
+
+
+def _render_index() -> bytes:
+    """Render the calculator page template."""
+    logger.info("Rendering calculator web interface")
+    return templates.get_template("calculator.html").render().encode()
+
+
 # Root endpoint - serve calculator web interface
 @app.get("/", response_class=HTMLResponse)
-async def read_root(request: Request) -> Response:
+async def read_root() -> Response:
     """Serve the calculator web interface."""
-    logger.info("Serving calculator web interface")
-    return templates.TemplateResponse("calculator.html", {"request": request})
+    global _index_html
+    if not _index_html:  # only when the app runs without its lifespan
+        _index_html = _render_index()
+    return HTMLResponse(_index_html)
 
 
 # Health check endpoint
@@ -86,131 +217,197 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "Calculator API"}
 
 
-# Addition endpoint
-@app.post("/add", response_model=CalculationResponse)
-async def add_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Add two numbers."""
-    try:
-        logger.info(f"Addition requested: {request.a} + {request.b}")
-        result = add(request.a, request.b)
-        return CalculationResponse(
-            result=result,
-            operation="addition",
-            operands={"a": request.a, "b": request.b},
-        )
-    except CalculatorError as e:
-        logger.error(f"Addition failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in addition: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# Subtraction endpoint
-@app.post("/subtract", response_model=CalculationResponse)
-async def subtract_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Subtract two numbers."""
+# Batch endpoint
+@app.post(
+    "/batch",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": BatchItem.model_json_schema(),
+                    }
+                }
+            },
+            "required": True,
+        }
+    },
+)
+async def batch_calculate(request: Request) -> List[Dict[str, object]]:
+    """Execute many calculator operations in a single request.
+
+    Amortizes the HTTP parse + validation overhead across the whole
+    batch instead of paying it once per operation. The body is parsed
+    with orjson and validated by hand, skipping the per-item Pydantic
+    model walk. Results are returned in input order; failed items carry
+    an "error" key instead of failing the whole batch.
+    """
     try:
-        logger.info(f"Subtraction requested: {request.a} - {request.b}")
-        result = subtract(request.a, request.b)
-        return CalculationResponse(
-            result=result,
-            operation="subtraction",
-            operands={"a": request.a, "b": request.b},
+        items = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be JSON")
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=422, detail="Request body must be a list of operations"
         )
-    except CalculatorError as e:
-        logger.error(f"Subtraction failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in subtraction: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# Multiplication endpoint
-@app.post("/multiply", response_model=CalculationResponse)
-async def multiply_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Multiply two numbers."""
-    try:
-        logger.info(f"Multiplication requested: {request.a} * {request.b}")
-        result = multiply(request.a, request.b)
-        return CalculationResponse(
-            result=result,
-            operation="multiplication",
-            operands={"a": request.a, "b": request.b},
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Batch size exceeds the limit of {MAX_BATCH_SIZE} operations",
         )
-    except CalculatorError as e:
-        logger.error(f"Multiplication failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in multiplication: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# Division endpoint
-@app.post("/divide", response_model=CalculationResponse)
-async def divide_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Divide two numbers."""
-    try:
-        logger.info(f"Division requested: {request.a} / {request.b}")
-        result = divide(request.a, request.b)
-        return CalculationResponse(
-            result=result,
-            operation="division",
-            operands={"a": request.a, "b": request.b},
-        )
-    except CalculatorError as e:
-        logger.error(f"Division failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in division: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# Power endpoint
-@app.post("/power", response_model=CalculationResponse)
-async def power_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Raise a number to a power."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Batch requested: %s operations", len(items))
+
+    ops: List[str] = []
+    a_vals: List[float] = []
+    b_vals: List[float] = []
     try:
-        logger.info(f"Power requested: {request.a} ^ {request.b}")
-        result = power(request.a, request.b)
-        return CalculationResponse(
-            result=result, operation="power", operands={"a": request.a, "b": request.b}
+        for item in items:
+            op_name = item["op"]
+            if op_name not in _UFUNCS:
+                raise ValueError(op_name)
+            ops.append(op_name)
+            a_vals.append(float(item["a"]))
+            b_vals.append(float(item["b"]))
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=422,
+            detail="Each item needs a known 'op' and numeric 'a' and 'b'",
         )
-    except CalculatorError as e:
-        logger.error(f"Power operation failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in power operation: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# Modulo endpoint
-@app.post("/modulo", response_model=CalculationResponse)
-async def modulo_numbers(request: CalculationRequest) -> CalculationResponse:
-    """Calculate modulo of two numbers."""
+
+    # Group items by operation so each group is one vectorized C loop,
+    # then scatter the results back into input order.
+    results: List[Dict[str, object]] = [{} for _ in items]
+    groups: Dict[str, List[int]] = {}
+    for i, op_name in enumerate(ops):
+        groups.setdefault(op_name, []).append(i)
+
+    for op_name, indices in groups.items():
+        n = len(indices)
+        a = np.fromiter((a_vals[i] for i in indices), dtype=np.float64, count=n)
+        b = np.fromiter((b_vals[i] for i in indices), dtype=np.float64, count=n)
+        zero_msg = _ZERO_DIVISOR_MESSAGES.get(op_name)
+        with np.errstate(all="ignore"):
+            if zero_msg is not None and np.any(b == 0):
+                valid = b != 0
+                out = np.full_like(a, np.nan)
+                out[valid] = _UFUNCS[op_name](a[valid], b[valid])
+            else:
+                valid = None
+                out = _UFUNCS[op_name](a, b)
+        finite = np.isfinite(out)
+        values = out.tolist()
+        if valid is None and finite.all():
+            for j, i in enumerate(indices):
+                results[i] = {"result": values[j]}
+        else:
+            for j, i in enumerate(indices):
+                if valid is not None and not valid[j]:
+                    results[i] = {"error": zero_msg}
+                elif not finite[j]:
+                    results[i] = {"error": _NONFINITE_MESSAGE}
+                else:
+                    results[i] = {"result": values[j]}
+
+    return results
+
+
+# Calculation endpoints - one handler dispatches all six operations
+@app.post(
+    "/{op}",
+    responses={200: {"model": CalculationResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": CalculationRequest.model_json_schema()}
+            },
+            "required": True,
+        }
+    },
+)
+async def calculate(op: str, request: Request) -> Response:
+    """Perform the calculator operation named by the path segment.
+
+    The two-float body is parsed with orjson directly instead of going
+    through Pydantic's core-schema walk; CalculationRequest is kept
+    only to document the body in OpenAPI.
+    """
+    entry = OPS.get(op)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Unknown operation: {op}")
+    fn, name = entry
     try:
-        logger.info(f"Modulo requested: {request.a} % {request.b}")
-        result = modulo(request.a, request.b)
-        return CalculationResponse(
-            result=result, operation="modulo", operands={"a": request.a, "b": request.b}
+        body = orjson.loads(await request.body())
+        a = float(body["a"])
+        b = float(body["b"])
+    except (KeyError, TypeError, ValueError, orjson.JSONDecodeError):
+        raise HTTPException(
+            status_code=422,
+            detail="Request body must be JSON with numeric fields 'a' and 'b'",
         )
-    except CalculatorError as e:
-        logger.error(f"Modulo operation failed: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error in modulo operation: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s requested: a=%s b=%s", name, a, b)
+    result = fn(a, b)
+    # Same rule as /batch: orjson would serialize inf/NaN as null, so a
+    # non-finite result is reported as an error instead.
+    if not math.isfinite(result):
+        raise OverflowError(f"{name} result is not finite")
+    return _RESPONDERS[op](result, a, b)
 
 
 # Exception handlers
 @app.exception_handler(CalculatorError)
 async def calculator_exception_handler(
     request: Request, exc: CalculatorError
-) -> HTTPException:
-    """Handle calculator-specific exceptions."""
-    logger.error(f"Calculator error: {exc}")
-    return HTTPException(status_code=400, detail=str(exc))
+) -> ORJSONResponse:
+    """Convert calculator errors to 400 responses in one place.
+
+    Handlers raise CalculatorError directly instead of each wrapping
+    its body in try/except. Keeps the {"detail": ...} payload shape
+    clients already parse.
+    """
+    logger.error("Calculator error: %s", exc)
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(OverflowError)
+async def overflow_exception_handler(
+    request: Request, exc: OverflowError
+) -> ORJSONResponse:
+    """Convert numeric overflow to a 400 response.
+
+    The operation functions let raw arithmetic overflow (e.g. a huge
+    power base) propagate rather than wrapping every body in
+    try/except; it is turned into a client error here.
+    """
+    logger.error("Overflow error: %s", exc)
+    return ORJSONResponse(
+        status_code=400, content={"detail": "Operation failed: result out of range"}
+    )
+
+
+@app.exception_handler(ZeroDivisionError)
+async def zero_division_exception_handler(
+    request: Request, exc: ZeroDivisionError
+) -> ORJSONResponse:
+    """Convert raw division by zero to the same 400 shape.
+
+    divide() and modulo() guard their divisors, so this is a backstop
+    in case an operation ever divides without going through them.
+    """
+    logger.error("Zero division error: %s", exc)
+    return ORJSONResponse(
+        status_code=400, content={"detail": "Division by zero is not allowed"}
+    )
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        loop="uvloop",
+        http="httptools",
+    )
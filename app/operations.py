@@ -1,13 +1,25 @@
 """
 Calculator operations module.
 Provides basic arithmetic operations with error handling.
+
+Functions are annotated with concrete float types so they are ready for
+AOT compilation (mypyc/Cython) if the package ever grows a build step;
+ints participate transparently at runtime as usual.
 """
 import logging
-from typing import Union
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None  # type: ignore[assignment]
+
+# Library module: no handler configuration here, the application owns
+# that. The NullHandler keeps "no handlers" warnings away when this
+# module is used standalone.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class CalculatorError(Exception):
@@ -16,9 +28,12 @@ class CalculatorError(Exception):
     pass
 
 
-def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+def add(a: float, b: float) -> float:
     """
-    Add two numbers with enhanced validation and logging.
+    Add two numbers.
+
+    Type validation happens upstream (Pydantic coerces request bodies),
+    so the hot path is just the arithmetic plus optional logging.
 
     Args:
         a: First number (addend)
@@ -27,9 +42,6 @@ def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     Returns:
         Sum of a and b
 
-    Raises:
-        CalculatorError: If input validation fails or overflow occurs
-
     Examples:
         >>> add(2, 3)
         5
@@ -38,24 +50,15 @@ def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> add(0.1, 0.2)
         0.30000000000000004
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        result = a + b
-        logger.info(f"Addition operation: {a} + {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in addition: {e}")
-        raise CalculatorError(f"Addition failed: {e}")
-
-
-def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    result = a + b
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Addition operation: %s + %s = %s", a, b, result)
+    return result
+
+
+def subtract(a: float, b: float) -> float:
     """
-    Subtract two numbers with enhanced validation and precision handling.
+    Subtract two numbers.
 
     Args:
         a: First number (minuend)
@@ -64,9 +67,6 @@ def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     Returns:
         Difference of a and b (a - b)
 
-    Raises:
-        CalculatorError: If input validation fails
-
     Examples:
         >>> subtract(5, 3)
         2
@@ -75,24 +75,15 @@ def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> subtract(3.5, 1.2)
         2.3
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        result = a - b
-        logger.info(f"Subtraction operation: {a} - {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in subtraction: {e}")
-        raise CalculatorError(f"Subtraction failed: {e}")
-
-
-def multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    result = a - b
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Subtraction operation: %s - %s = %s", a, b, result)
+    return result
+
+
+def multiply(a: float, b: float) -> float:
     """
-    Multiply two numbers with enhanced validation and overflow handling.
+    Multiply two numbers.
 
     Args:
         a: First number (multiplicand)
@@ -101,9 +92,6 @@ def multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     Returns:
         Product of a and b
 
-    Raises:
-        CalculatorError: If input validation fails or overflow occurs
-
     Examples:
         >>> multiply(3, 4)
         12
@@ -114,24 +102,15 @@ def multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> multiply(0, 100)
         0
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        result = a * b
-        logger.info(f"Multiplication operation: {a} * {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in multiplication: {e}")
-        raise CalculatorError(f"Multiplication failed: {e}")
-
-
-def divide(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    result = a * b
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Multiplication operation: %s * %s = %s", a, b, result)
+    return result
+
+
+def divide(a: float, b: float) -> float:
     """
-    Divide two numbers with comprehensive validation and precision handling.
+    Divide two numbers.
 
     Args:
         a: First number (dividend)
@@ -141,7 +120,7 @@ def divide(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         Quotient of a and b
 
     Raises:
-        CalculatorError: If division by zero is attempted or input validation fails
+        CalculatorError: If division by zero is attempted
 
     Examples:
         >>> divide(10, 2)
@@ -153,29 +132,14 @@ def divide(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> divide(0, 5)
         0.0
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        # Division by zero check
-        if b == 0:
-            logger.error("Division by zero attempted")
-            raise CalculatorError("Division by zero is not allowed")
-
-        result = a / b
-        logger.info(f"Division operation: {a} / {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in division: {e}")
-        raise CalculatorError(f"Division failed: {e}")
-
-
-def power(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    if b == 0:
+        raise CalculatorError("Division by zero is not allowed")
+    return a / b
+
+
+def power(a: float, b: float) -> float:
     """
-    Raise a number to a power with validation and overflow protection.
+    Raise a number to a power with overflow protection.
 
     Args:
         a: Base number
@@ -185,7 +149,7 @@ def power(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         a raised to the power of b
 
     Raises:
-        CalculatorError: If input validation fails or overflow occurs
+        CalculatorError: If the exponent is large enough to risk overflow
 
     Examples:
         >>> power(2, 3)
@@ -199,29 +163,25 @@ def power(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> power(10, -2)
         0.01
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        # Check for potential overflow with large exponents
-        if isinstance(b, int) and abs(b) > 1000:
-            logger.warning(f"Large exponent detected: {b}")
-            raise CalculatorError("Exponent too large, potential overflow")
-
-        result = a**b
-        logger.info(f"Power operation: {a} ^ {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in power operation: {e}")
-        raise CalculatorError(f"Power operation failed: {e}")
-
-
-def modulo(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    # Check for potential overflow with large exponents. The API layer
+    # coerces both operands to float, so the guard must not gate on the
+    # exponent being an int.
+    if abs(b) > 1000:
+        logger.warning("Large exponent detected: %s", b)
+        raise CalculatorError("Exponent too large, potential overflow")
+
+    # typeshed types float ** float as Any (a negative base with a
+    # fractional exponent yields complex); the annotation pins the
+    # result for --warn-return-any.
+    result: float = a**b
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Power operation: %s ^ %s = %s", a, b, result)
+    return result
+
+
+def modulo(a: float, b: float) -> float:
     """
-    Calculate modulo (remainder) of two numbers with comprehensive validation.
+    Calculate modulo (remainder) of two numbers.
 
     Args:
         a: First number (dividend)
@@ -231,7 +191,7 @@ def modulo(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         Modulo of a and b (remainder when a is divided by b)
 
     Raises:
-        CalculatorError: If modulo by zero is attempted or input validation fails
+        CalculatorError: If modulo by zero is attempted
 
     Examples:
         >>> modulo(10, 3)
@@ -245,21 +205,36 @@ def modulo(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         >>> modulo(5.5, 2)
         1.5
     """
-    try:
-        # Input validation
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise CalculatorError("Both arguments must be numbers")
-
-        # Modulo by zero check
-        if b == 0:
-            logger.error("Modulo by zero attempted")
-            raise CalculatorError("Modulo by zero is not allowed")
-
-        result = a % b
-        logger.info(f"Modulo operation: {a} % {b} = {result}")
-        return result
-    except CalculatorError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in modulo operation: {e}")
-        raise CalculatorError(f"Modulo operation failed: {e}")
+    if b == 0:
+        raise CalculatorError("Modulo by zero is not allowed")
+    return a % b
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _pow_kernel(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> np.ndarray:
+        for i in range(a.shape[0]):
+            out[i] = a[i] ** b[i]
+        return out
+
+
+def power_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Raise each element of a to the matching element of b.
+
+    Uses a numba-compiled kernel when numba is installed, falling back
+    to NumPy's ufunc otherwise, so batch power workloads skip the
+    per-element interpreter dispatch that a Python loop would pay.
+
+    Args:
+        a: Array of base values
+        b: Array of exponents, same shape as a
+
+    Returns:
+        Array of a ** b, element-wise
+    """
+    out = np.empty_like(a)
+    if njit is not None:
+        return _pow_kernel(a, b, out)
+    return np.power(a, b, out)
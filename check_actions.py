@@ -4,9 +4,6 @@ Script to demonstrate GitHub Actions workflow status checking.
 This shows how to programmatically check the status of your CI/CD pipeline.
 """
 
-import requests
-import json
-import time
 from datetime import datetime
 
 def check_github_actions_status():
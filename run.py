@@ -1,14 +1,17 @@
 """
 Application startup script for FastAPI Calculator.
 """
+import os
+
 import uvicorn
-from app.main import app
 
 if __name__ == "__main__":
     uvicorn.run(
-        app,
+        "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        loop="uvloop",
+        http="httptools",
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures for the calculator test suite.
+"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Session-scoped application instance, imported lazily.
+
+    Importing app.main builds the FastAPI app and its Pydantic schemas;
+    deferring that to first use keeps collection (--collect-only, -k)
+    cheap and lets xdist workers pay the import only when they actually
+    run a test that needs the app.
+    """
+    from app.main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def ops():
+    """The app.operations module, resolved once per session.
+
+    Tests take the operation callables off this fixture so each case
+    does a local argument dereference instead of repeating module-level
+    attribute lookups.
+    """
+    import app.operations
+
+    return app.operations
+
+
+@pytest.fixture(scope="session")
+def approx():
+    """pytest.approx, shared so float tests take it as a local argument."""
+    return pytest.approx
+
+
+@pytest.fixture
+def assert_raises_calc_error():
+    """Factory asserting a call raises CalculatorError with a message."""
+
+    def _assert(op, match, *args):
+        from app.operations import CalculatorError
+
+        with pytest.raises(CalculatorError, match=match):
+            op(*args)
+
+    return _assert
@@ -2,19 +2,30 @@
 Integration tests for FastAPI Calculator endpoints.
 Tests all API endpoints in app/main.py
 """
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-# Create test client
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client(app):
+    """Session-scoped TestClient entered once so lifespan runs once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _payload(a, b):
+    """Serialize a two-operand body once, when the parametrize table is built."""
+    return orjson.dumps({"a": a, "b": b})
+
+
+_JSON = {"content-type": "application/json"}
 
 
 class TestHealthEndpoint:
     """Test cases for health check endpoint."""
 
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint returns correct status."""
         response = client.get("/health")
         assert response.status_code == 200
@@ -26,50 +37,67 @@ class TestHealthEndpoint:
 class TestRootEndpoint:
     """Test cases for root endpoint serving web interface."""
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test root endpoint serves HTML page."""
         response = client.get("/")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
         assert "FastAPI Calculator" in response.text
 
+    def test_page_structure_in_html(self, client):
+        """Test the served HTML contains the calculator markup."""
+        body = client.get("/").text
+        assert "<title>FastAPI Calculator</title>" in body
+        assert "<h1>" in body
+        assert 'id="display"' in body
+        assert 'class="btn' in body
+
+    def test_asset_links_are_relative(self, client):
+        """Test asset URLs do not bake in the requesting host or scheme."""
+        body = client.get("/", headers={"host": "other.example"}).text
+        assert 'href="/static/styles.css"' in body
+        assert 'src="/static/script.js"' in body
+        assert "other.example" not in body
+
+    def test_api_info_in_html(self, client):
+        """Test the API information section lists the endpoints."""
+        body = client.get("/").text
+        assert 'class="api-info"' in body
+        for endpoint in (
+            "POST /add",
+            "POST /subtract",
+            "POST /multiply",
+            "POST /divide",
+            "POST /power",
+            "POST /modulo",
+            "GET /docs",
+            "GET /health",
+        ):
+            assert endpoint in body
+
 
 class TestAdditionEndpoint:
     """Test cases for addition endpoint."""
 
-    def test_add_positive_numbers(self):
-        """Test adding positive numbers via API."""
-        response = client.post("/add", json={"a": 5, "b": 3})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 8
-        assert data["operation"] == "addition"
-        assert data["operands"] == {"a": 5, "b": 3}
-
-    def test_add_negative_numbers(self):
-        """Test adding negative numbers via API."""
-        response = client.post("/add", json={"a": -5, "b": -3})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(5, 3), 5, 3, 8),  # positive numbers
+            (_payload(-5, -3), -5, -3, -8),  # negative numbers
+            (_payload(2.5, 3.7), 2.5, 3.7, 6.2),  # floats
+            (_payload(10, -4), 10, -4, 6),  # mixed signs
+        ],
+    )
+    def test_add(self, client, payload, a, b, expected):
+        """Test addition across representative operand combinations."""
+        response = client.post("/add", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == -8
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "addition"
+        assert data["operands"] == {"a": a, "b": b}
 
-    def test_add_floats(self):
-        """Test adding floating point numbers via API."""
-        response = client.post("/add", json={"a": 2.5, "b": 3.7})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == pytest.approx(6.2)
-        assert data["operation"] == "addition"
-
-    def test_add_mixed_numbers(self):
-        """Test adding positive and negative numbers via API."""
-        response = client.post("/add", json={"a": 10, "b": -4})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 6
-
-    def test_add_invalid_input(self):
+    def test_add_invalid_input(self, client):
         """Test addition with invalid input."""
         response = client.post("/add", json={"a": "invalid", "b": 5})
         assert response.status_code == 422  # Validation error
@@ -78,205 +106,203 @@ class TestAdditionEndpoint:
 class TestSubtractionEndpoint:
     """Test cases for subtraction endpoint."""
 
-    def test_subtract_positive_numbers(self):
-        """Test subtracting positive numbers via API."""
-        response = client.post("/subtract", json={"a": 10, "b": 4})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(10, 4), 10, 4, 6),  # positive numbers
+            (_payload(-5, -8), -5, -8, 3),  # negative numbers
+            (_payload(3, 8), 3, 8, -5),  # negative result
+            (_payload(7.5, 2.3), 7.5, 2.3, 5.2),  # floats
+        ],
+    )
+    def test_subtract(self, client, payload, a, b, expected):
+        """Test subtraction across representative operand combinations."""
+        response = client.post("/subtract", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 6
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "subtraction"
-        assert data["operands"] == {"a": 10, "b": 4}
-
-    def test_subtract_negative_numbers(self):
-        """Test subtracting negative numbers via API."""
-        response = client.post("/subtract", json={"a": -5, "b": -8})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 3
-
-    def test_subtract_result_negative(self):
-        """Test subtraction resulting in negative number."""
-        response = client.post("/subtract", json={"a": 3, "b": 8})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == -5
-
-    def test_subtract_floats(self):
-        """Test subtracting floating point numbers via API."""
-        response = client.post("/subtract", json={"a": 7.5, "b": 2.3})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == pytest.approx(5.2)
+        assert data["operands"] == {"a": a, "b": b}
 
 
 class TestMultiplicationEndpoint:
     """Test cases for multiplication endpoint."""
 
-    def test_multiply_positive_numbers(self):
-        """Test multiplying positive numbers via API."""
-        response = client.post("/multiply", json={"a": 6, "b": 7})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(6, 7), 6, 7, 42),  # positive numbers
+            (_payload(5, 0), 5, 0, 0),  # multiply by zero
+            (_payload(-4, -3), -4, -3, 12),  # negative numbers
+            (_payload(-4, 3), -4, 3, -12),  # mixed signs
+            (_payload(2.5, 4.0), 2.5, 4.0, 10.0),  # floats
+        ],
+    )
+    def test_multiply(self, client, payload, a, b, expected):
+        """Test multiplication across representative operand combinations."""
+        response = client.post("/multiply", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 42
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "multiplication"
-        assert data["operands"] == {"a": 6, "b": 7}
-
-    def test_multiply_by_zero(self):
-        """Test multiplying by zero via API."""
-        response = client.post("/multiply", json={"a": 5, "b": 0})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 0
-
-    def test_multiply_negative_numbers(self):
-        """Test multiplying negative numbers via API."""
-        response = client.post("/multiply", json={"a": -4, "b": -3})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 12
-
-    def test_multiply_mixed_signs(self):
-        """Test multiplying numbers with different signs."""
-        response = client.post("/multiply", json={"a": -4, "b": 3})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == -12
-
-    def test_multiply_floats(self):
-        """Test multiplying floating point numbers via API."""
-        response = client.post("/multiply", json={"a": 2.5, "b": 4.0})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 10.0
+        assert data["operands"] == {"a": a, "b": b}
 
 
 class TestDivisionEndpoint:
     """Test cases for division endpoint."""
 
-    def test_divide_positive_numbers(self):
-        """Test dividing positive numbers via API."""
-        response = client.post("/divide", json={"a": 15, "b": 3})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(15, 3), 15, 3, 5),  # positive numbers
+            (_payload(-12, -4), -12, -4, 3),  # negative numbers
+            (_payload(-12, 4), -12, 4, -3),  # mixed signs
+            (_payload(7.5, 2.5), 7.5, 2.5, 3.0),  # floats
+            (_payload(0, 5), 0, 5, 0),  # zero dividend
+        ],
+    )
+    def test_divide(self, client, payload, a, b, expected):
+        """Test division across representative operand combinations."""
+        response = client.post("/divide", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 5
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "division"
-        assert data["operands"] == {"a": 15, "b": 3}
+        assert data["operands"] == {"a": a, "b": b}
 
-    def test_divide_by_zero(self):
+    def test_divide_by_zero(self, client):
         """Test division by zero returns error."""
         response = client.post("/divide", json={"a": 5, "b": 0})
         assert response.status_code == 400
         data = response.json()
         assert "Division by zero is not allowed" in data["detail"]
 
-    def test_divide_negative_numbers(self):
-        """Test dividing negative numbers via API."""
-        response = client.post("/divide", json={"a": -12, "b": -4})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 3
-
-    def test_divide_mixed_signs(self):
-        """Test dividing numbers with different signs."""
-        response = client.post("/divide", json={"a": -12, "b": 4})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == -3
-
-    def test_divide_floats(self):
-        """Test dividing floating point numbers via API."""
-        response = client.post("/divide", json={"a": 7.5, "b": 2.5})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 3.0
-
-    def test_divide_zero_by_number(self):
-        """Test dividing zero by a number."""
-        response = client.post("/divide", json={"a": 0, "b": 5})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 0
-
 
 class TestPowerEndpoint:
     """Test cases for power endpoint."""
 
-    def test_power_positive_numbers(self):
-        """Test power operation with positive numbers via API."""
-        response = client.post("/power", json={"a": 2, "b": 3})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(2, 3), 2, 3, 8),  # positive numbers
+            (_payload(5, 0), 5, 0, 1),  # zero exponent
+            (_payload(-2, 3), -2, 3, -8),  # negative base
+            (_payload(4, 0.5), 4, 0.5, 2.0),  # fractional exponent
+        ],
+    )
+    def test_power(self, client, payload, a, b, expected):
+        """Test power across representative operand combinations."""
+        response = client.post("/power", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 8
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "power"
-        assert data["operands"] == {"a": 2, "b": 3}
+        assert data["operands"] == {"a": a, "b": b}
 
-    def test_power_zero_exponent(self):
-        """Test power with zero exponent."""
-        response = client.post("/power", json={"a": 5, "b": 0})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 1
-
-    def test_power_negative_base(self):
-        """Test power with negative base."""
-        response = client.post("/power", json={"a": -2, "b": 3})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == -8
+    @pytest.mark.parametrize("exponent", [2000, 2000.5, -2000])
+    def test_power_large_exponent_rejected(self, client, exponent):
+        """Test oversized exponents are rejected before evaluation."""
+        response = client.post("/power", json={"a": 2, "b": exponent})
+        assert response.status_code == 400
+        assert "Exponent too large" in response.json()["detail"]
 
-    def test_power_fractional_exponent(self):
-        """Test power with fractional exponent."""
-        response = client.post("/power", json={"a": 4, "b": 0.5})
-        assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == 2.0
+    def test_power_overflow_result(self, client):
+        """Test a result too large for a float returns a 400 error."""
+        response = client.post("/power", json={"a": 1e308, "b": 2})
+        assert response.status_code == 400
+        assert "out of range" in response.json()["detail"]
 
 
 class TestModuloEndpoint:
     """Test cases for modulo endpoint."""
 
-    def test_modulo_positive_numbers(self):
-        """Test modulo operation with positive numbers via API."""
-        response = client.post("/modulo", json={"a": 10, "b": 3})
+    @pytest.mark.parametrize(
+        "payload,a,b,expected",
+        [
+            (_payload(10, 3), 10, 3, 1),  # positive numbers
+            (_payload(15, 5), 15, 5, 0),  # even division
+            (_payload(-7, 3), -7, 3, 2),  # negative dividend
+            (_payload(7.5, 2.5), 7.5, 2.5, 0.0),  # floats
+        ],
+    )
+    def test_modulo(self, client, payload, a, b, expected):
+        """Test modulo across representative operand combinations."""
+        response = client.post("/modulo", content=payload, headers=_JSON)
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 1
+        assert data["result"] == pytest.approx(expected)
         assert data["operation"] == "modulo"
-        assert data["operands"] == {"a": 10, "b": 3}
+        assert data["operands"] == {"a": a, "b": b}
 
-    def test_modulo_by_zero(self):
+    def test_modulo_by_zero(self, client):
         """Test modulo by zero returns error."""
         response = client.post("/modulo", json={"a": 5, "b": 0})
         assert response.status_code == 400
         data = response.json()
         assert "Modulo by zero is not allowed" in data["detail"]
 
-    def test_modulo_even_division(self):
-        """Test modulo with even division."""
-        response = client.post("/modulo", json={"a": 15, "b": 5})
+
+class TestBatchEndpoint:
+    """Test cases for batch calculation endpoint."""
+
+    def test_batch_mixed_operations(self, client):
+        """Test a batch of different operations returns results in order."""
+        response = client.post(
+            "/batch",
+            json=[
+                {"op": "add", "a": 5, "b": 3},
+                {"op": "multiply", "a": 6, "b": 7},
+                {"op": "power", "a": 2, "b": 3},
+            ],
+        )
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 0
-
-    def test_modulo_negative_numbers(self):
-        """Test modulo with negative numbers."""
-        response = client.post("/modulo", json={"a": -7, "b": 3})
+        assert [item["result"] for item in data] == [8, 42, 8]
+
+    def test_batch_error_item(self, client):
+        """Test a failing item reports an error without failing the batch."""
+        response = client.post(
+            "/batch",
+            json=[
+                {"op": "divide", "a": 10, "b": 2},
+                {"op": "divide", "a": 5, "b": 0},
+            ],
+        )
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == 2
-
-    def test_modulo_floats(self):
-        """Test modulo with floating point numbers."""
-        response = client.post("/modulo", json={"a": 7.5, "b": 2.5})
+        assert data[0]["result"] == 5
+        assert "Division by zero is not allowed" in data[1]["error"]
+
+    def test_batch_nonfinite_item(self, client):
+        """Test an overflowing item reports an error, not a null result."""
+        response = client.post(
+            "/batch",
+            json=[
+                {"op": "power", "a": 2, "b": 2000},
+                {"op": "add", "a": 1, "b": 1},
+            ],
+        )
         assert response.status_code == 200
         data = response.json()
-        assert data["result"] == pytest.approx(0.0)
+        assert data[0] == {"error": "Result out of range"}
+        assert data[1]["result"] == 2
+
+    def test_batch_unknown_operation(self, client):
+        """Test an unknown operation is rejected by validation."""
+        response = client.post("/batch", json=[{"op": "cube", "a": 2, "b": 3}])
+        assert response.status_code == 422
+
+    def test_batch_size_limit(self, client):
+        """Test oversized batches are rejected."""
+        items = [{"op": "add", "a": 1, "b": 1}] * 101
+        response = client.post("/batch", json=items)
+        assert response.status_code == 422
 
 
 class TestErrorHandling:
     """Test cases for error handling across endpoints."""
 
-    def test_missing_parameters(self):
+    def test_missing_parameters(self, client):
         """Test endpoints with missing parameters."""
         response = client.post("/add", json={"a": 5})
         assert response.status_code == 422
@@ -284,7 +310,7 @@ class TestErrorHandling:
         response = client.post("/subtract", json={"b": 3})
         assert response.status_code == 422
 
-    def test_invalid_data_types(self):
+    def test_invalid_data_types(self, client):
         """Test endpoints with invalid data types."""
         response = client.post("/multiply", json={"a": "invalid", "b": 5})
         assert response.status_code == 422
@@ -292,7 +318,14 @@ class TestErrorHandling:
         response = client.post("/divide", json={"a": 5, "b": "invalid"})
         assert response.status_code == 422
 
-    def test_empty_request_body(self):
+    @pytest.mark.parametrize("op", ["add", "multiply"])
+    def test_nonfinite_result(self, client, op):
+        """Test a result too large for a float returns a 400 error."""
+        response = client.post(f"/{op}", json={"a": 1e308, "b": 1e308})
+        assert response.status_code == 400
+        assert "out of range" in response.json()["detail"]
+
+    def test_empty_request_body(self, client):
         """Test endpoints with empty request body."""
         response = client.post("/add", json={})
         assert response.status_code == 422
@@ -304,22 +337,11 @@ class TestErrorHandling:
 class TestAPIDocumentation:
     """Test cases for API documentation endpoints."""
 
-    def test_openapi_schema(self):
-        """Test OpenAPI schema is accessible."""
+    def test_openapi_schema(self, client):
+        """Test OpenAPI schema is accessible and documents this app's routes."""
         response = client.get("/openapi.json")
         assert response.status_code == 200
         schema = response.json()
         assert "openapi" in schema
-        assert "paths" in schema
-
-    def test_docs_endpoint(self):
-        """Test interactive documentation is accessible."""
-        response = client.get("/docs")
-        assert response.status_code == 200
-        assert "swagger" in response.text.lower()
-
-    def test_redoc_endpoint(self):
-        """Test ReDoc documentation is accessible."""
-        response = client.get("/redoc")
-        assert response.status_code == 200
-        assert "redoc" in response.text.lower()
+        for path in ("/", "/health", "/batch", "/{op}"):
+            assert path in schema["paths"]
@@ -1,7 +1,12 @@
 """
 Unit tests for calculator operations.
 Tests all functions in app/operations.py
+
+Tests are module-level functions grouped by comment block; pytest then
+skips per-item class instantiation across the parametrized cases.
 """
+from typing import Callable
+
 import pytest
 
 from app.operations import (
@@ -14,268 +19,338 @@ from app.operations import (
     subtract,
 )
 
+# One module-level filter instead of pytest re-applying a per-item
+# filter stack across the parametrized explosion; also keeps the
+# arithmetic deprecation-clean.
+pytestmark = [pytest.mark.filterwarnings("error::DeprecationWarning")]
+
+# Bound once at import; raises checks read the module constant.
+ERR = CalculatorError
+
+# Name -> callable table for tests parametrized over the operation
+# name: a C-level dict lookup per case instead of getattr resolution.
+OPS: dict[str, Callable[[float, float], float]] = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+    "power": power,
+    "modulo": modulo,
+}
+
+# Case tables are frozen module-level tuples so collection materializes
+# them once and re-collection (xdist workers, --lf/--ff) reuses them.
+# Float rows carry an exact/approx flag so an ApproxBase object is only
+# built for rows where exact float equality does not hold.
+Case = tuple[float, float, float]
+FloatCase = tuple[str, float, float, float]
+
+ADD_CASES: tuple[Case, ...] = (
+    (2, 3, 5),
+    (10, 5, 15),
+    (100, 200, 300),
+    (-2, -3, -5),
+    (-10, -5, -15),
+    (-100, -200, -300),
+    (5, -3, 2),
+    (-5, 3, -2),
+    (10, -10, 0),
+    (0, 5, 5),
+    (5, 0, 5),
+    (0, 0, 0),
+)
+
+ADD_FLOAT_CASES: tuple[FloatCase, ...] = (
+    ("exact", 2.5, 3.5, 6.0),
+    ("approx", 1.1, 2.2, 3.3),
+    ("exact", -1.5, 1.5, 0.0),
+)
+
+SUBTRACT_CASES: tuple[Case, ...] = (
+    (5, 3, 2),
+    (10, 4, 6),
+    (100, 50, 50),
+    (-5, -3, -2),
+    (-10, -15, 5),
+    (-100, -200, 100),
+    (5, -3, 8),
+    (-5, 3, -8),
+    (0, 5, -5),
+    (5, 0, 5),
+    (0, 0, 0),
+)
+
+SUBTRACT_FLOAT_CASES: tuple[FloatCase, ...] = (
+    ("exact", 5.5, 2.5, 3.0),
+    ("approx", 1.1, 0.1, 1.0),
+    ("exact", -2.5, -1.5, -1.0),
+)
+
+MULTIPLY_CASES: tuple[Case, ...] = (
+    (2, 3, 6),
+    (4, 5, 20),
+    (10, 10, 100),
+    (-2, -3, 6),
+    (-4, -5, 20),
+    (-10, -10, 100),
+    (2, -3, -6),
+    (-4, 5, -20),
+    (-10, 10, -100),
+    (5, 0, 0),
+    (0, 5, 0),
+    (0, 0, 0),
+    (-5, 0, 0),
+    (5, 1, 5),
+    (1, 5, 5),
+    (-5, 1, -5),
+)
+
+MULTIPLY_FLOAT_CASES: tuple[Case, ...] = (
+    (2.5, 4.0, 10.0),
+    (1.5, 2.0, 3.0),
+    (-2.5, 2.0, -5.0),
+)
+
+DIVIDE_CASES: tuple[Case, ...] = (
+    (6, 2, 3),
+    (15, 3, 5),
+    (100, 10, 10),
+    (-6, -2, 3),
+    (-15, -3, 5),
+    (-100, -10, 10),
+    (6, -2, -3),
+    (-15, 3, -5),
+    (-100, 10, -10),
+    (5, 1, 5),
+    (-5, 1, -5),
+    (0, 1, 0),
+    (0, 5, 0),
+    (0, -5, 0),
+)
+
+DIVIDE_FLOAT_CASES: tuple[Case, ...] = (
+    (7.5, 2.5, 3.0),
+    (1.0, 4.0, 0.25),
+    (-8.0, 2.0, -4.0),
+)
+
+POWER_CASES: tuple[Case, ...] = (
+    (2, 3, 8),
+    (3, 2, 9),
+    (5, 2, 25),
+    (5, 0, 1),
+    (-5, 0, 1),
+    (0, 0, 1),
+    (5, 1, 5),
+    (-5, 1, -5),
+    (0, 1, 0),
+    (-2, 2, 4),
+    (-2, 3, -8),
+    (-3, 2, 9),
+    (2, -2, 0.25),
+    (4, -2, 0.0625),
+    (10, -1, 0.1),
+)
+
+POWER_FRACTIONAL_CASES: tuple[FloatCase, ...] = (
+    ("exact", 4, 0.5, 2.0),
+    ("exact", 9, 0.5, 3.0),
+    ("approx", 8, 1 / 3, 2.0),
+)
+
+MODULO_CASES: tuple[Case, ...] = (
+    (7, 3, 1),
+    (10, 4, 2),
+    (15, 5, 0),
+    (-7, 3, 2),
+    (7, -3, -2),
+    (-7, -3, -1),
+    (5, 1, 0),
+    (-5, 1, 0),
+    (0, 1, 0),
+    (0, 5, 0),
+    (0, -5, 0),
+)
+
+MODULO_FLOAT_CASES: tuple[FloatCase, ...] = (
+    ("exact", 7.5, 2.5, 0.0),
+    ("exact", 8.5, 3.0, 2.5),
+    ("approx", 10.7, 3.2, 1.1),
+)
+
+
+def _case_ids(group, sym, cases):
+    """Pre-format parametrize ids once at import time.
+
+    Ids are "<group>/<expression>" so `pytest -k "add/"` selects a
+    whole group, standing in for the dropped class grouping. Explicit
+    ids skip pytest's per-parameter repr-based id generation during
+    collection; rows may lead with an exact/approx flag, so the
+    operands are taken from the tail of each row.
+    """
+    return tuple(f"{group}/{row[-3]}{sym}{row[-2]}={row[-1]}" for row in cases)
+
+
+ADD_IDS = _case_ids("add", "+", ADD_CASES)
+ADD_FLOAT_IDS = _case_ids("add", "+", ADD_FLOAT_CASES)
+SUBTRACT_IDS = _case_ids("subtract", "-", SUBTRACT_CASES)
+SUBTRACT_FLOAT_IDS = _case_ids("subtract", "-", SUBTRACT_FLOAT_CASES)
+MULTIPLY_IDS = _case_ids("multiply", "*", MULTIPLY_CASES)
+MULTIPLY_FLOAT_IDS = _case_ids("multiply", "*", MULTIPLY_FLOAT_CASES)
+DIVIDE_IDS = _case_ids("divide", "/", DIVIDE_CASES)
+DIVIDE_FLOAT_IDS = _case_ids("divide", "/", DIVIDE_FLOAT_CASES)
+POWER_IDS = _case_ids("power", "^", POWER_CASES)
+POWER_FRACTIONAL_IDS = _case_ids("power", "^", POWER_FRACTIONAL_CASES)
+MODULO_IDS = _case_ids("modulo", "%", MODULO_CASES)
+MODULO_FLOAT_IDS = _case_ids("modulo", "%", MODULO_FLOAT_CASES)
+
+
+# Addition
+
+
+@pytest.mark.parametrize("a,b,expected", ADD_CASES, ids=ADD_IDS)
+def test_add(ops, a, b, expected):
+    """Test addition across signs and zero."""
+    assert ops.add(a, b) == expected
+
+
+@pytest.mark.parametrize("mode,a,b,expected", ADD_FLOAT_CASES, ids=ADD_FLOAT_IDS)
+def test_add_floats(ops, approx, mode, a, b, expected):
+    """Test adding floating point numbers."""
+    assert ops.add(a, b) == (approx(expected) if mode == "approx" else expected)
+
+
+# Subtraction
+
+
+@pytest.mark.parametrize("a,b,expected", SUBTRACT_CASES, ids=SUBTRACT_IDS)
+def test_subtract(ops, a, b, expected):
+    """Test subtraction across signs and zero."""
+    assert ops.subtract(a, b) == expected
+
+
+@pytest.mark.parametrize(
+    "mode,a,b,expected", SUBTRACT_FLOAT_CASES, ids=SUBTRACT_FLOAT_IDS
+)
+def test_subtract_floats(ops, approx, mode, a, b, expected):
+    """Test subtracting floating point numbers."""
+    assert ops.subtract(a, b) == (approx(expected) if mode == "approx" else expected)
+
+
+# Multiplication
+
+
+@pytest.mark.parametrize("a,b,expected", MULTIPLY_CASES, ids=MULTIPLY_IDS)
+def test_multiply(ops, a, b, expected):
+    """Test multiplication across signs, zero and identity."""
+    assert ops.multiply(a, b) == expected
+
+
+@pytest.mark.parametrize("a,b,expected", MULTIPLY_FLOAT_CASES, ids=MULTIPLY_FLOAT_IDS)
+def test_multiply_floats(ops, a, b, expected):
+    """Test multiplying floating point numbers (all rows exact)."""
+    assert ops.multiply(a, b) == expected
+
+
+# Division
+
+
+@pytest.mark.parametrize("a,b,expected", DIVIDE_CASES, ids=DIVIDE_IDS)
+def test_divide(ops, a, b, expected):
+    """Test division across signs, identity and zero dividend."""
+    assert ops.divide(a, b) == expected
+
+
+@pytest.mark.parametrize("a,b,expected", DIVIDE_FLOAT_CASES, ids=DIVIDE_FLOAT_IDS)
+def test_divide_floats(ops, a, b, expected):
+    """Test dividing floating point numbers (all rows exact)."""
+    assert ops.divide(a, b) == expected
+
+
+# Power
+
+
+@pytest.mark.parametrize("a,b,expected", POWER_CASES, ids=POWER_IDS)
+def test_power(ops, a, b, expected):
+    """Test power across bases, exponent signs and zero."""
+    assert ops.power(a, b) == expected
+
+
+@pytest.mark.parametrize(
+    "mode,a,b,expected", POWER_FRACTIONAL_CASES, ids=POWER_FRACTIONAL_IDS
+)
+def test_power_fractional_exponent(ops, approx, mode, a, b, expected):
+    """Test power with fractional exponent."""
+    assert ops.power(a, b) == (approx(expected) if mode == "approx" else expected)
+
+
+# Modulo
+
+
+@pytest.mark.parametrize("a,b,expected", MODULO_CASES, ids=MODULO_IDS)
+def test_modulo(ops, a, b, expected):
+    """Test modulo across signs, identity and zero dividend."""
+    assert ops.modulo(a, b) == expected
+
+
+@pytest.mark.parametrize("mode,a,b,expected", MODULO_FLOAT_CASES, ids=MODULO_FLOAT_IDS)
+def test_modulo_floats(ops, approx, mode, a, b, expected):
+    """Test modulo with floating point numbers."""
+    assert ops.modulo(a, b) == (
+        approx(expected, abs=1e-10) if mode == "approx" else expected
+    )
+
+
+# Error handling
+
+
+@pytest.mark.parametrize(
+    "op_name,args,msg",
+    [
+        ("divide", (5, 0), "Division by zero is not allowed"),
+        ("modulo", (5, 0), "Modulo by zero is not allowed"),
+        ("power", (2, 2000), "Exponent too large"),
+        ("power", (2, 2000.5), "Exponent too large"),
+        ("power", (2, -2000), "Exponent too large"),
+    ],
+)
+def test_error_message(op_name, args, msg):
+    """Test CalculatorError is raised with a descriptive message."""
+    with pytest.raises(ERR) as exc_info:
+        OPS[op_name](*args)
+    assert msg in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "op_name,msg",
+    [
+        ("divide", "Division by zero is not allowed"),
+        ("modulo", "Modulo by zero is not allowed"),
+    ],
+)
+@pytest.mark.parametrize("num", [5, -5, 0])
+def test_zero_divisor(assert_raises_calc_error, op_name, msg, num):
+    """Test divide and modulo reject a zero divisor for any dividend."""
+    assert_raises_calc_error(OPS[op_name], msg, num, 0)
+
+
+# Batch power helper
+
+
+def test_power_batch_matches_scalar(ops):
+    """Test batch power agrees with the scalar power function."""
+    import numpy as np
+
+    a = np.array([2.0, 3.0, 4.0, 10.0])
+    b = np.array([3.0, 2.0, 0.5, -2.0])
+    result = ops.power_batch(a, b)
+    expected = [ops.power(x, y) for x, y in zip(a, b)]
+    assert result == pytest.approx(expected)
+
+
+def test_power_batch_empty(ops):
+    """Test batch power on an empty array."""
+    import numpy as np
 
-class TestAddition:
-    """Test cases for addition operation."""
-
-    def test_add_positive_numbers(self):
-        """Test adding positive numbers."""
-        assert add(2, 3) == 5
-        assert add(10, 5) == 15
-        assert add(100, 200) == 300
-
-    def test_add_negative_numbers(self):
-        """Test adding negative numbers."""
-        assert add(-2, -3) == -5
-        assert add(-10, -5) == -15
-        assert add(-100, -200) == -300
-
-    def test_add_mixed_numbers(self):
-        """Test adding positive and negative numbers."""
-        assert add(5, -3) == 2
-        assert add(-5, 3) == -2
-        assert add(10, -10) == 0
-
-    def test_add_zero(self):
-        """Test adding zero."""
-        assert add(0, 5) == 5
-        assert add(5, 0) == 5
-        assert add(0, 0) == 0
-
-    def test_add_floats(self):
-        """Test adding floating point numbers."""
-        assert add(2.5, 3.5) == 6.0
-        assert add(1.1, 2.2) == pytest.approx(3.3)
-        assert add(-1.5, 1.5) == 0.0
-
-
-class TestSubtraction:
-    """Test cases for subtraction operation."""
-
-    def test_subtract_positive_numbers(self):
-        """Test subtracting positive numbers."""
-        assert subtract(5, 3) == 2
-        assert subtract(10, 4) == 6
-        assert subtract(100, 50) == 50
-
-    def test_subtract_negative_numbers(self):
-        """Test subtracting negative numbers."""
-        assert subtract(-5, -3) == -2
-        assert subtract(-10, -15) == 5
-        assert subtract(-100, -200) == 100
-
-    def test_subtract_mixed_numbers(self):
-        """Test subtracting mixed positive and negative numbers."""
-        assert subtract(5, -3) == 8
-        assert subtract(-5, 3) == -8
-        assert subtract(0, 5) == -5
-
-    def test_subtract_zero(self):
-        """Test subtracting zero."""
-        assert subtract(5, 0) == 5
-        assert subtract(0, 5) == -5
-        assert subtract(0, 0) == 0
-
-    def test_subtract_floats(self):
-        """Test subtracting floating point numbers."""
-        assert subtract(5.5, 2.5) == 3.0
-        assert subtract(1.1, 0.1) == pytest.approx(1.0)
-        assert subtract(-2.5, -1.5) == -1.0
-
-
-class TestMultiplication:
-    """Test cases for multiplication operation."""
-
-    def test_multiply_positive_numbers(self):
-        """Test multiplying positive numbers."""
-        assert multiply(2, 3) == 6
-        assert multiply(4, 5) == 20
-        assert multiply(10, 10) == 100
-
-    def test_multiply_negative_numbers(self):
-        """Test multiplying negative numbers."""
-        assert multiply(-2, -3) == 6
-        assert multiply(-4, -5) == 20
-        assert multiply(-10, -10) == 100
-
-    def test_multiply_mixed_numbers(self):
-        """Test multiplying positive and negative numbers."""
-        assert multiply(2, -3) == -6
-        assert multiply(-4, 5) == -20
-        assert multiply(-10, 10) == -100
-
-    def test_multiply_by_zero(self):
-        """Test multiplying by zero."""
-        assert multiply(5, 0) == 0
-        assert multiply(0, 5) == 0
-        assert multiply(0, 0) == 0
-        assert multiply(-5, 0) == 0
-
-    def test_multiply_by_one(self):
-        """Test multiplying by one."""
-        assert multiply(5, 1) == 5
-        assert multiply(1, 5) == 5
-        assert multiply(-5, 1) == -5
-
-    def test_multiply_floats(self):
-        """Test multiplying floating point numbers."""
-        assert multiply(2.5, 4.0) == 10.0
-        assert multiply(1.5, 2.0) == 3.0
-        assert multiply(-2.5, 2.0) == -5.0
-
-
-class TestDivision:
-    """Test cases for division operation."""
-
-    def test_divide_positive_numbers(self):
-        """Test dividing positive numbers."""
-        assert divide(6, 2) == 3
-        assert divide(15, 3) == 5
-        assert divide(100, 10) == 10
-
-    def test_divide_negative_numbers(self):
-        """Test dividing negative numbers."""
-        assert divide(-6, -2) == 3
-        assert divide(-15, -3) == 5
-        assert divide(-100, -10) == 10
-
-    def test_divide_mixed_numbers(self):
-        """Test dividing positive and negative numbers."""
-        assert divide(6, -2) == -3
-        assert divide(-15, 3) == -5
-        assert divide(-100, 10) == -10
-
-    def test_divide_by_one(self):
-        """Test dividing by one."""
-        assert divide(5, 1) == 5
-        assert divide(-5, 1) == -5
-        assert divide(0, 1) == 0
-
-    def test_divide_zero_by_number(self):
-        """Test dividing zero by a number."""
-        assert divide(0, 5) == 0
-        assert divide(0, -5) == 0
-        assert divide(0, 1) == 0
-
-    def test_divide_by_zero(self):
-        """Test dividing by zero raises an error."""
-        with pytest.raises(CalculatorError, match="Division by zero is not allowed"):
-            divide(5, 0)
-
-        with pytest.raises(CalculatorError, match="Division by zero is not allowed"):
-            divide(-5, 0)
-
-        with pytest.raises(CalculatorError, match="Division by zero is not allowed"):
-            divide(0, 0)
-
-    def test_divide_floats(self):
-        """Test dividing floating point numbers."""
-        assert divide(7.5, 2.5) == 3.0
-        assert divide(1.0, 4.0) == 0.25
-        assert divide(-8.0, 2.0) == -4.0
-
-
-class TestPower:
-    """Test cases for power operation."""
-
-    def test_power_positive_numbers(self):
-        """Test power with positive numbers."""
-        assert power(2, 3) == 8
-        assert power(3, 2) == 9
-        assert power(5, 2) == 25
-
-    def test_power_with_zero_exponent(self):
-        """Test power with zero exponent."""
-        assert power(5, 0) == 1
-        assert power(-5, 0) == 1
-        assert power(0, 0) == 1
-
-    def test_power_with_one_exponent(self):
-        """Test power with exponent of one."""
-        assert power(5, 1) == 5
-        assert power(-5, 1) == -5
-        assert power(0, 1) == 0
-
-    def test_power_negative_base(self):
-        """Test power with negative base."""
-        assert power(-2, 2) == 4
-        assert power(-2, 3) == -8
-        assert power(-3, 2) == 9
-
-    def test_power_negative_exponent(self):
-        """Test power with negative exponent."""
-        assert power(2, -2) == 0.25
-        assert power(4, -2) == 0.0625
-        assert power(10, -1) == 0.1
-
-    def test_power_fractional_exponent(self):
-        """Test power with fractional exponent."""
-        assert power(4, 0.5) == 2.0
-        assert power(9, 0.5) == 3.0
-        assert power(8, 1 / 3) == pytest.approx(2.0)
-
-
-class TestModulo:
-    """Test cases for modulo operation."""
-
-    def test_modulo_positive_numbers(self):
-        """Test modulo with positive numbers."""
-        assert modulo(7, 3) == 1
-        assert modulo(10, 4) == 2
-        assert modulo(15, 5) == 0
-
-    def test_modulo_negative_numbers(self):
-        """Test modulo with negative numbers."""
-        assert modulo(-7, 3) == 2
-        assert modulo(7, -3) == -2
-        assert modulo(-7, -3) == -1
-
-    def test_modulo_by_one(self):
-        """Test modulo by one."""
-        assert modulo(5, 1) == 0
-        assert modulo(-5, 1) == 0
-        assert modulo(0, 1) == 0
-
-    def test_modulo_zero(self):
-        """Test modulo with zero dividend."""
-        assert modulo(0, 5) == 0
-        assert modulo(0, -5) == 0
-
-    def test_modulo_by_zero(self):
-        """Test modulo by zero raises an error."""
-        with pytest.raises(CalculatorError, match="Modulo by zero is not allowed"):
-            modulo(5, 0)
-
-        with pytest.raises(CalculatorError, match="Modulo by zero is not allowed"):
-            modulo(-5, 0)
-
-        with pytest.raises(CalculatorError, match="Modulo by zero is not allowed"):
-            modulo(0, 0)
-
-    def test_modulo_floats(self):
-        """Test modulo with floating point numbers."""
-        assert modulo(7.5, 2.5) == pytest.approx(0.0)
-        assert modulo(8.5, 3.0) == pytest.approx(2.5)
-        assert modulo(10.7, 3.2) == pytest.approx(1.1, abs=1e-10)
-
-
-class TestErrorHandling:
-    """Test cases for error handling."""
-
-    def test_calculator_error_type(self):
-        """Test that CalculatorError is properly raised."""
-        with pytest.raises(CalculatorError):
-            divide(1, 0)
-
-        with pytest.raises(CalculatorError):
-            modulo(1, 0)
-
-    def test_calculator_error_message(self):
-        """Test that error messages are descriptive."""
-        with pytest.raises(CalculatorError) as exc_info:
-            divide(5, 0)
-        assert "Division by zero is not allowed" in str(exc_info.value)
-
-        with pytest.raises(CalculatorError) as exc_info:
-            modulo(5, 0)
-        assert "Modulo by zero is not allowed" in str(exc_info.value)
+    result = ops.power_batch(np.array([], dtype=np.float64), np.array([]))
+    assert result.shape == (0,)